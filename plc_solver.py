@@ -13,7 +13,32 @@ Baseado no modelo matemático:
     yi ∈ {0,1}, ∀i∈I
 """
 
+import sys
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import highspy
+import numpy as np
 from pulp import *
+from scipy.optimize import linprog
+
+# Resultado dos solvers que não devolvem objetos PuLP
+ResultadoPLC = namedtuple("ResultadoPLC", ["status", "objetivo", "y", "x"])
+
+# Solver CBC compartilhado entre as chamadas de resolver_plc.
+# Instanciar PULP_CBC_CMD a cada chamada refaz a busca pelo executável
+# do CBC no sistema de arquivos; threads=1 evita o custo de criar um
+# time de threads para MIPs minúsculos como estes. Presolve, cortes,
+# strong branching e heurísticas custam mais para inicializar do que a
+# resolução da relaxação com 3 binárias — todos desligados.
+_SOLVER = PULP_CBC_CMD(msg=0, threads=1, presolve=False, cuts=False,
+                    strong=0, maxNodes=100, options=["heuristics off"])
+
+# Variante que repassa ao CBC os valores iniciais das variáveis como
+# MIP start (usada quando resolver_plc recebe y_inicial)
+_SOLVER_WARM = PULP_CBC_CMD(msg=0, threads=1, presolve=False, cuts=False,
+                            strong=0, maxNodes=100,
+                            options=["heuristics off"], warmStart=True)
 
 
 def gerar_formato_lindo(custos_instalacao, custos_transporte, ofertas, demandas, cds_instalados, nome="PLC"):
@@ -23,6 +48,12 @@ def gerar_formato_lindo(custos_instalacao, custos_transporte, ofertas, demandas,
     num_cds = len(ofertas)
     num_ccs = len(demandas)
 
+    # Nomes das variáveis formatados uma única vez e reutilizados em
+    # todas as seções (objetivo, restrições e INT)
+    nomes_y = [f"Y{i+1}" for i in range(num_cds)]
+    nomes_x = [[f"X{i+1}{j+1}" for j in range(num_ccs)]
+            for i in range(num_cds)]
+
     lindo_code = []
     lindo_code.append(f"! {nome} - Problema de Localização de Capacidades")
     lindo_code.append("! Texas Petro S/A")
@@ -35,26 +66,31 @@ def gerar_formato_lindo(custos_instalacao, custos_transporte, ofertas, demandas,
     # Custos de instalação
     for i in range(num_cds):
         if custos_instalacao[i] > 0:
-            termos.append(f"{custos_instalacao[i]} Y{i+1}")
+            termos.append(f"{custos_instalacao[i]} {nomes_y[i]}")
 
     # Custos de transporte
     for i in range(num_cds):
         for j in range(num_ccs):
-            termos.append(f"{custos_transporte[i][j]} X{i+1}{j+1}")
+            termos.append(f"{custos_transporte[i][j]} {nomes_x[i][j]}")
 
-    # Quebrar em linhas de até 60 caracteres
-    linha_atual = ""
+    # Quebrar em linhas de até 60 caracteres; os pedaços são acumulados
+    # numa lista (com o separador embutido) e unidos uma única vez, em
+    # vez de concatenar strings repetidamente
+    buf = []
+    tam_linha = 0
     for termo in termos:
-        if len(linha_atual) + len(termo) + 3 > 60:
-            lindo_code.append(linha_atual)
-            linha_atual = "+ " + termo
+        if tam_linha + len(termo) + 3 > 60:
+            lindo_code.append("".join(buf))
+            buf = ["+ " + termo]
+            tam_linha = len(termo) + 2
+        elif buf:
+            buf.append(" + " + termo)
+            tam_linha += len(termo) + 3
         else:
-            if linha_atual:
-                linha_atual += " + " + termo
-            else:
-                linha_atual = termo
-    if linha_atual:
-        lindo_code.append(linha_atual)
+            buf = [termo]
+            tam_linha = len(termo)
+    if buf:
+        lindo_code.append("".join(buf))
 
     lindo_code.append("")
     lindo_code.append("SUBJECT TO")
@@ -63,8 +99,8 @@ def gerar_formato_lindo(custos_instalacao, custos_transporte, ofertas, demandas,
     # Restrições de capacidade
     lindo_code.append("! Restrições de Capacidade")
     for i in range(num_cds):
-        restricao = " + ".join([f"X{i+1}{j+1}" for j in range(num_ccs)])
-        restricao += f" - {ofertas[i]} Y{i+1} <= 0"
+        restricao = " + ".join(nomes_x[i])
+        restricao += f" - {ofertas[i]} {nomes_y[i]} <= 0"
         lindo_code.append(restricao)
 
     lindo_code.append("")
@@ -72,7 +108,7 @@ def gerar_formato_lindo(custos_instalacao, custos_transporte, ofertas, demandas,
     # Restrições de demanda
     lindo_code.append("! Restrições de Demanda")
     for j in range(num_ccs):
-        restricao = " + ".join([f"X{i+1}{j+1}" for i in range(num_cds)])
+        restricao = " + ".join(nomes_x[i][j] for i in range(num_cds))
         restricao += f" = {demandas[j]}"
         lindo_code.append(restricao)
 
@@ -82,7 +118,7 @@ def gerar_formato_lindo(custos_instalacao, custos_transporte, ofertas, demandas,
     if cds_instalados:
         lindo_code.append("! CDs já instalados")
         for i in cds_instalados:
-            lindo_code.append(f"Y{i+1} = 1")
+            lindo_code.append(f"{nomes_y[i]} = 1")
 
     lindo_code.append("")
     lindo_code.append("END")
@@ -90,12 +126,11 @@ def gerar_formato_lindo(custos_instalacao, custos_transporte, ofertas, demandas,
 
     # Variáveis inteiras (binárias)
     lindo_code.append("INT")
-    for i in range(num_cds):
-        lindo_code.append(f"Y{i+1}")
+    lindo_code.extend(nomes_y)
 
     return "\n".join(lindo_code)
 
-def resolver_plc(nome_problema, custos_instalacao, custos_transporte, ofertas, demandas, cds_instalados):
+def resolver_plc(nome_problema, custos_instalacao, custos_transporte, ofertas, demandas, cds_instalados, y_inicial=None):
     """
     Resolve o Problema de Localização de Capacidades
     
@@ -106,117 +141,422 @@ def resolver_plc(nome_problema, custos_instalacao, custos_transporte, ofertas, d
     - ofertas: Lista com oferta de cada CD [a1, a2, a3]
     - demandas: Lista com demanda de cada CC [b1, b2, b3, b4, b5]
     - cds_instalados: Lista de CDs já instalados (índices começando em 0)
+    - y_inicial: Vetor y de uma solução anterior, passado ao CBC como
+      MIP start (útil ao encadear instâncias parecidas, ex.: A depois B)
     """
     
     num_cds = len(ofertas)
     num_ccs = len(demandas)
-    
+
     # Criar o problema de minimização
     prob = LpProblem(nome_problema, LpMinimize)
-    
+
     # Variáveis de decisão
     # yi = 1 se CD i é instalado, 0 caso contrário
     y = [LpVariable(f"y{i+1}", cat='Binary') for i in range(num_cds)]
-    
+
+    # Viabilidade agregada: se nem todos os CDs abertos cobrem a demanda
+    # total, não há solução — retornar antes de lançar o subprocesso do CBC
+    if sum(demandas) > sum(ofertas):
+        prob.status = LpStatusInfeasible
+        return prob, y, [LpVariable(f"x{i+1}{j+1}", lowBound=0,
+                                    cat='Continuous')
+                        for i in range(num_cds) for j in range(num_ccs)]
+
+    # CDs com custo de instalação zero podem ser tratados como já
+    # instalados: abri-los nunca piora o ótimo e reduz o espaço de busca
+    cds_instalados = list(cds_instalados)
+    for i in range(num_cds):
+        if custos_instalacao[i] == 0 and i not in cds_instalados:
+            cds_instalados.append(i)
+
     # xij = quantidade transportada do CD i para CC j
-    x = [[LpVariable(f"x{i+1}{j+1}", lowBound=0, cat='Continuous') 
-        for j in range(num_ccs)] for i in range(num_cds)]
-    
+    # (lista plana indexada por i * num_ccs + j: indexação aritmética,
+    # sem o hash de tuplas de um dicionário)
+    x = [LpVariable(f"x{i+1}{j+1}", lowBound=0, cat='Continuous')
+        for i in range(num_cds) for j in range(num_ccs)]
+
     # Função Objetivo: Minimizar custos de instalação + custos de transporte
-    prob += (
-        lpSum([custos_instalacao[i] * y[i] for i in range(num_cds)]) +
-        lpSum([custos_transporte[i][j] * x[i][j] 
-            for i in range(num_cds) for j in range(num_ccs)])
+    # Montada de uma vez via LpAffineExpression (evita a acumulação
+    # termo a termo do lpSum, que cria expressões intermediárias)
+    prob += LpAffineExpression(
+        [(y[i], custos_instalacao[i]) for i in range(num_cds)] +
+        [(x[i * num_ccs + j], custos_transporte[i][j])
+            for i in range(num_cds) for j in range(num_ccs)]
     ), "Custo_Total"
-    
-    # Restrições de capacidade: Σ(j) xij ≤ ai * yi
+
+    # Restrições de capacidade: Σ(j) xij - ai * yi ≤ 0
     for i in range(num_cds):
         prob += (
-            lpSum([x[i][j] for j in range(num_ccs)]) <= ofertas[i] * y[i],
+            LpAffineExpression(
+                [(x[i * num_ccs + j], 1) for j in range(num_ccs)] +
+                [(y[i], -ofertas[i])]
+            ) <= 0,
             f"Capacidade_CD{i+1}"
         )
-    
+
     # Restrições de demanda: Σ(i) xij = bj
     for j in range(num_ccs):
         prob += (
-            lpSum([x[i][j] for i in range(num_cds)]) == demandas[j],
+            LpAffineExpression(
+                [(x[i * num_ccs + j], 1) for i in range(num_cds)]
+            ) == demandas[j],
             f"Demanda_CC{j+1}"
         )
     
-    # CDs já instalados devem permanecer instalados
+    # CDs já instalados devem permanecer instalados: fixar os limites
+    # da variável não gera linha na matriz (nada para o presolve eliminar)
     for i in cds_instalados:
-        prob += y[i] == 1, f"CD{i+1}_Instalado"
+        y[i].lowBound = 1
     
-    # Resolver o problema
-    prob.solve(PULP_CBC_CMD(msg=0))
+    # Resolver o problema (com warm start, se houver solução anterior)
+    if y_inicial is not None:
+        for i in range(num_cds):
+            y[i].setInitialValue(int(round(y_inicial[i])))
+        prob.solve(_SOLVER_WARM)
+    else:
+        prob.solve(_SOLVER)
     
     return prob, y, x
 
 
-def exibir_resultados(prob, y, x, nome, custos_instalacao, custos_transporte, ofertas, demandas):
-    """Exibe os resultados da otimização"""
-    
+def atualizar_demandas(prob, demandas, rotulo=""):
+    """
+    Troca o lado direito das restrições de demanda sem reconstruir o modelo
+
+    Para estudos de sensibilidade (variar bj e re-resolver) a
+    reconstrução das LpVariables e restrições domina o tempo; aqui só a
+    constante das linhas Demanda_CC* é mutada e o mesmo prob pode ser
+    passado de novo ao solve. rotulo identifica o combustível quando o
+    modelo veio de resolver_plc_lote.
+    """
+
+    for j, b in enumerate(demandas):
+        restricao = prob.constraints[f"Demanda_CC{j+1}{rotulo and '_' + rotulo}"]
+        restricao.changeRHS(float(b))
+
+
+def atualizar_ofertas(prob, y, ofertas, rotulo=""):
+    """
+    Troca as capacidades nas restrições Σ(j) xij - ai*yi ≤ 0
+
+    A oferta entra como coeficiente de yi (não como lado direito), então
+    a mutação é no coeficiente da variável dentro da linha. Mesmo uso de
+    rotulo de atualizar_demandas.
+    """
+
+    for i, a in enumerate(ofertas):
+        restricao = prob.constraints[f"Capacidade_CD{i+1}{rotulo and '_' + rotulo}"]
+        restricao.expr[y[i]] = -float(a)
+        restricao.modified = True
+
+
+def resolver_plc_lote(nome_problema, custos_instalacao, combustiveis, cds_instalados):
+    """
+    Resolve vários combustíveis em um único MIP bloco-diagonal
+
+    Cada chamada ao CBC paga o custo de iniciar o subprocesso; juntar os
+    combustíveis num único problema (variáveis y e x próprias por
+    combustível, restrições independentes) amortiza esse custo em uma só
+    resolução.
+
+    Parâmetros:
+    - combustiveis: lista de tuplas (rotulo, custos_transporte, ofertas, demandas)
+
+    Retorna (prob, resultados), onde resultados é uma lista de tuplas
+    (objetivo_expr, y, x) na ordem dos combustíveis; o valor ótimo de
+    cada combustível é value(objetivo_expr) após a resolução.
+    """
+
+    prob = LpProblem(nome_problema, LpMinimize)
+
+    resultados = []
+    objetivo_total = LpAffineExpression()
+
+    for rotulo, custos_transporte, ofertas, demandas in combustiveis:
+        num_cds = len(ofertas)
+        num_ccs = len(demandas)
+
+        y = [LpVariable(f"y{rotulo}{i+1}", cat='Binary')
+            for i in range(num_cds)]
+        x = [LpVariable(f"x{rotulo}{i+1}{j+1}", lowBound=0,
+                        cat='Continuous')
+            for i in range(num_cds) for j in range(num_ccs)]
+
+        objetivo = LpAffineExpression(
+            [(y[i], custos_instalacao[i]) for i in range(num_cds)] +
+            [(x[i * num_ccs + j], custos_transporte[i][j])
+                for i in range(num_cds) for j in range(num_ccs)]
+        )
+        objetivo_total += objetivo
+
+        for i in range(num_cds):
+            prob += (
+                LpAffineExpression(
+                    [(x[i * num_ccs + j], 1) for j in range(num_ccs)] +
+                    [(y[i], -ofertas[i])]
+                ) <= 0,
+                f"Capacidade_CD{i+1}_{rotulo}"
+            )
+
+        for j in range(num_ccs):
+            prob += (
+                LpAffineExpression(
+                    [(x[i * num_ccs + j], 1) for i in range(num_cds)]
+                ) == demandas[j],
+                f"Demanda_CC{j+1}_{rotulo}"
+            )
+
+        # Fixado via limite da variável, sem linha extra na matriz
+        for i in cds_instalados:
+            y[i].lowBound = 1
+
+        resultados.append((objetivo, y, x))
+
+    prob += objetivo_total, "Custo_Total"
+
+    prob.solve(_SOLVER)
+
+    return prob, resultados
+
+
+def resolver_plc_highs(custos_instalacao, custos_transporte, ofertas, demandas, cds_instalados):
+    """
+    Resolve o PLC com o HiGHS em processo (highspy), sem subprocesso
+
+    O caminho PuLP + CBC escreve o modelo em arquivo, lança o executável
+    cbc e lê a resposta em texto — para 15 variáveis esse overhead supera
+    em muito o branch-and-bound em si. Aqui o modelo é montado direto nas
+    estruturas do HiGHS e resolvido no mesmo processo.
+
+    Retorna ResultadoPLC(status, objetivo, y, x) com y lista 0/1 e x
+    matriz [CD][CC].
+    """
+
+    num_cds = len(ofertas)
+    num_ccs = len(demandas)
+    num_vars = num_cds + num_cds * num_ccs
+    inf = highspy.kHighsInf
+
+    h = highspy.Highs()
+    h.silent()
+
+    # Colunas: y1..yn seguidas de x11..xnm (x na ordem [CD][CC])
+    custos = np.concatenate([
+        np.asarray(custos_instalacao, dtype=np.float64),
+        np.asarray(custos_transporte, dtype=np.float64).ravel(),
+    ])
+    inferior = np.zeros(num_vars)
+    superior = np.full(num_vars, inf)
+    superior[:num_cds] = 1.0
+    for i in cds_instalados:
+        inferior[i] = 1.0  # fixa o CD já instalado sem gerar restrição
+    h.addCols(num_vars, custos, inferior, superior,
+            0, np.empty(0, dtype=np.int32), np.empty(0, dtype=np.int32),
+            np.empty(0))
+    h.changeColsIntegrality(
+        num_cds, np.arange(num_cds, dtype=np.int32),
+        np.full(num_cds, highspy.HighsVarType.kInteger))
+
+    # Linhas de capacidade (Σj xij - ai*yi ≤ 0) e de demanda (Σi xij = bj)
+    inicios = []
+    indices = []
+    valores = []
+    linf = []
+    lsup = []
+    for i in range(num_cds):
+        inicios.append(len(indices))
+        indices.append(i)
+        valores.append(-float(ofertas[i]))
+        for j in range(num_ccs):
+            indices.append(num_cds + i * num_ccs + j)
+            valores.append(1.0)
+        linf.append(-inf)
+        lsup.append(0.0)
+    for j in range(num_ccs):
+        inicios.append(len(indices))
+        for i in range(num_cds):
+            indices.append(num_cds + i * num_ccs + j)
+            valores.append(1.0)
+        linf.append(float(demandas[j]))
+        lsup.append(float(demandas[j]))
+    h.addRows(num_cds + num_ccs,
+            np.asarray(linf), np.asarray(lsup), len(indices),
+            np.asarray(inicios, dtype=np.int32),
+            np.asarray(indices, dtype=np.int32),
+            np.asarray(valores))
+
+    h.run()
+
+    if h.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+        return ResultadoPLC(h.modelStatusToString(h.getModelStatus()),
+                            None, None, None)
+
+    solucao = np.asarray(h.getSolution().col_value)
+    y = [int(round(v)) for v in solucao[:num_cds]]
+    x = solucao[num_cds:].reshape(num_cds, num_ccs)
+
+    return ResultadoPLC("Optimal", h.getInfo().objective_function_value, y, x)
+
+
+def resolver_plc_enumerativo(custos_instalacao, custos_transporte, ofertas, demandas, cds_instalados):
+    """
+    Resolve o PLC por enumeração explícita das combinações de instalação
+
+    Com poucos CDs existem apenas 2^n vetores y possíveis; fixado o y, o
+    que sobra é um problema de transporte puro (LP), resolvido aqui pelo
+    simplex dual do HiGHS via scipy.optimize.linprog — sem o custo de
+    iniciar o subprocesso do CBC a cada chamada.
+
+    Retorna (status, objetivo, y, x), onde y é uma lista 0/1 e x é a
+    matriz de transporte [CD][CC] da melhor combinação encontrada.
+    """
+
+    num_cds = len(ofertas)
+    num_ccs = len(demandas)
+
+    c = np.asarray(custos_transporte, dtype=np.float64).ravel()
+    demanda_total = sum(demandas)
+
+    # Restrições de demanda: Σ(i) xij = bj (uma linha por CC)
+    A_eq = np.zeros((num_ccs, num_cds * num_ccs))
+    for j in range(num_ccs):
+        A_eq[j, j::num_ccs] = 1.0
+    b_eq = np.asarray(demandas, dtype=np.float64)
+
+    # Restrições de capacidade: Σ(j) xij ≤ ai*yi (b_ub depende do y)
+    A_ub = np.zeros((num_cds, num_cds * num_ccs))
+    for i in range(num_cds):
+        A_ub[i, i * num_ccs:(i + 1) * num_ccs] = 1.0
+
+    # Máscara de bits dos CDs que precisam estar instalados
+    obrigatorios = 0
+    for i in cds_instalados:
+        obrigatorios |= 1 << i
+
+    melhor_custo = None
+    melhor_y = None
+    melhor_x = None
+
+    for mask in range(1 << num_cds):
+        # Pular combinações sem os CDs já instalados ou sem capacidade
+        if (mask & obrigatorios) != obrigatorios:
+            continue
+        y = [(mask >> i) & 1 for i in range(num_cds)]
+        if sum(ofertas[i] * y[i] for i in range(num_cds)) < demanda_total:
+            continue
+
+        b_ub = np.array([ofertas[i] * y[i] for i in range(num_cds)],
+                        dtype=np.float64)
+        res = linprog(c, A_ub=A_ub, b_ub=b_ub, A_eq=A_eq, b_eq=b_eq,
+                    bounds=(0, None), method='highs-ds')
+        if not res.success:
+            continue
+
+        custo = res.fun + sum(custos_instalacao[i] * y[i]
+                            for i in range(num_cds))
+        if melhor_custo is None or custo < melhor_custo:
+            melhor_custo = custo
+            melhor_y = y
+            melhor_x = res.x.reshape(num_cds, num_ccs)
+
+    if melhor_y is None:
+        return "Infeasible", None, None, None
+
+    return "Optimal", melhor_custo, melhor_y, melhor_x
+
+
+def exibir_resultados(prob, y, x, nome, custos_instalacao, custos_transporte, ofertas, demandas, objetivo=None):
+    """
+    Exibe os resultados da otimização
+
+    objetivo permite informar o valor ótimo do combustível quando ele
+    não coincide com o objetivo do problema (caso da resolução em lote).
+    """
+
     num_cds = len(y)
     num_ccs = len(demandas)
+
+    # Vetores-solução extraídos uma única vez: cada value() percorre a
+    # expressão do PuLP, então instalação, totais por CD/CC, custos e o
+    # próprio objetivo saem todos destes arrays
+    y_valores = np.fromiter(
+        (value(y[i]) for i in range(num_cds)),
+        dtype=np.float64, count=num_cds
+    )
+    x_valores = np.fromiter(
+        (value(x[i * num_ccs + j])
+            for i in range(num_cds) for j in range(num_ccs)),
+        dtype=np.float64, count=num_cds * num_ccs
+    ).reshape(num_cds, num_ccs)
+    custo_transporte_total = float(np.sum(x_valores * custos_transporte))
+
+    if objetivo is None:
+        # Produto escalar direto, sem percorrer a expressão do objetivo
+        objetivo = float(np.dot(custos_instalacao, y_valores)) \
+            + custo_transporte_total
+
+    # O relatório inteiro é montado em memória e emitido numa única
+    # escrita em stdout, em vez de uma syscall por print
+    saida = []
+
+    saida.append("=" * 70)
+    saida.append(f"RESULTADO - {nome}")
+    saida.append("=" * 70)
+    saida.append(f"\nStatus: {LpStatus[prob.status]}")
+    saida.append(f"\nValor Ótimo da Função Objetivo: R$ {objetivo:,.2f}")
     
-    print("=" * 70)
-    print(f"RESULTADO - {nome}")
-    print("=" * 70)
-    print(f"\nStatus: {LpStatus[prob.status]}")
-    print(f"\nValor Ótimo da Função Objetivo: R$ {value(prob.objective):,.2f}")
-    
-    print("\n" + "-" * 40)
-    print("DECISÕES DE INSTALAÇÃO:")
-    print("-" * 40)
+    saida.append("\n" + "-" * 40)
+    saida.append("DECISÕES DE INSTALAÇÃO:")
+    saida.append("-" * 40)
     
     custo_instalacao_total = 0
     for i in range(num_cds):
-        status = "INSTALADO" if value(y[i]) == 1 else "NÃO INSTALADO"
-        custo = custos_instalacao[i] if value(y[i]) == 1 else 0
+        status = "INSTALADO" if y_valores[i] == 1 else "NÃO INSTALADO"
+        custo = custos_instalacao[i] if y_valores[i] == 1 else 0
         custo_instalacao_total += custo
-        print(f"  CD{i+1}: {status} (Custo: R$ {custos_instalacao[i]:,.2f})")
+        saida.append(f"  CD{i+1}: {status} (Custo: R$ {custos_instalacao[i]:,.2f})")
     
-    print(f"\n  Custo Total de Instalação: R$ {custo_instalacao_total:,.2f}")
+    saida.append(f"\n  Custo Total de Instalação: R$ {custo_instalacao_total:,.2f}")
     
-    print("\n" + "-" * 40)
-    print("PLANO DE TRANSPORTE (toneladas):")
-    print("-" * 40)
+    saida.append("\n" + "-" * 40)
+    saida.append("PLANO DE TRANSPORTE (toneladas):")
+    saida.append("-" * 40)
     
     # Cabeçalho
     header = "       " + "".join([f"CC{j+1:>8}" for j in range(num_ccs)]) + "    Total"
-    print(header)
+    saida.append(header)
     
-    custo_transporte_total = 0
+    totais_cd = x_valores.sum(axis=1)
+    totais_cc = x_valores.sum(axis=0)
+
     for i in range(num_cds):
         linha = f"  CD{i+1}: "
-        total_cd = 0
         for j in range(num_ccs):
-            val = value(x[i][j])
-            linha += f"{val:>8.1f}"
-            total_cd += val
-            custo_transporte_total += val * custos_transporte[i][j]
-        linha += f"  {total_cd:>6.1f}"
-        print(linha)
-    
+            linha += f"{x_valores[i][j]:>8.1f}"
+        linha += f"  {totais_cd[i]:>6.1f}"
+        saida.append(linha)
+
     # Linha de demanda atendida
-    print("  " + "-" * (8 * num_ccs + 15))
+    saida.append("  " + "-" * (8 * num_ccs + 15))
     demanda_linha = "  Dem.: "
     for j in range(num_ccs):
-        total_cc = sum(value(x[i][j]) for i in range(num_cds))
-        demanda_linha += f"{total_cc:>8.1f}"
-    print(demanda_linha)
+        demanda_linha += f"{totais_cc[j]:>8.1f}"
+    saida.append(demanda_linha)
     
-    print(f"\n  Custo Total de Transporte: R$ {custo_transporte_total:,.2f}")
+    saida.append(f"\n  Custo Total de Transporte: R$ {custo_transporte_total:,.2f}")
     
-    print("\n" + "=" * 70)
-    print("INTERPRETAÇÃO DA SOLUÇÃO:")
-    print("=" * 70)
+    saida.append("\n" + "=" * 70)
+    saida.append("INTERPRETAÇÃO DA SOLUÇÃO:")
+    saida.append("=" * 70)
     
-    cds_abertos = [i+1 for i in range(num_cds) if value(y[i]) == 1]
-    print(f"\n  → A solução ótima indica que os seguintes CDs devem operar: {cds_abertos}")
-    print(f"  → Custo total (instalação + transporte): R$ {value(prob.objective):,.2f}")
-    
-    return value(prob.objective)
+    cds_abertos = [i+1 for i in range(num_cds) if y_valores[i] == 1]
+    saida.append(f"\n  → A solução ótima indica que os seguintes CDs devem operar: {cds_abertos}")
+    saida.append(f"  → Custo total (instalação + transporte): R$ {objetivo:,.2f}")
+
+    sys.stdout.write("\n".join(saida) + "\n")
+
+    return objetivo
 
 
 def main():
@@ -236,43 +576,77 @@ def main():
 
     # Custos de instalação (CD1 já está instalado, custo = 0)
     # CD1: já instalado, CD2: R$ 500.000, CD3: R$ 450.000
-    custos_instalacao = [0, 500000, 450000]
+    # Dados inteiros em np.int32: armazenamento contíguo de 4 bytes por
+    # valor (uma lista de ints guarda objetos PyLong de ~28 bytes)
+    custos_instalacao = np.array([0, 500000, 450000], dtype=np.int32)
 
     # CD1 já está instalado (índice 0)
     cds_instalados = [0]
 
-    # -------------------------------------------------------------------------
-    # COMBUSTÍVEL A
-    # -------------------------------------------------------------------------
-    print("\n" + "▓" * 70)
-    print("  COMBUSTÍVEL A")
-    print("▓" * 70)
-
     # Custos de transporte [CD][CC] - Combustível A
-    custos_transporte_A = [
+    custos_transporte_A = np.array([
         [60, 65, 78, 67, 84],  # CD1 -> CC1, CC2, CC3, CC4, CC5
         [45, 54, 76, 53, 32],  # CD2 -> CC1, CC2, CC3, CC4, CC5
         [31, 43, 54, 65, 72],  # CD3 -> CC1, CC2, CC3, CC4, CC5
-    ]
+    ], dtype=np.int32)
+
+    # Ofertas (capacidade) de cada CD em toneladas
+    ofertas_A = np.array([50, 75, 85], dtype=np.int32)
+
+    # Demandas de cada CC em toneladas
+    demandas_A = np.array([16, 20, 12, 18, 14], dtype=np.int32)  # Total = 80 toneladas
+
+    # Custos de transporte [CD][CC] - Combustível B
+    custos_transporte_B = np.array([
+        [37, 39, 54, 45, 25],  # CD1 -> CC1, CC2, CC3, CC4, CC5
+        [23, 34, 21, 34, 70],  # CD2 -> CC1, CC2, CC3, CC4, CC5
+        [21, 38, 45, 38, 68],  # CD3 -> CC1, CC2, CC3, CC4, CC5
+    ], dtype=np.int32)
 
     # Ofertas (capacidade) de cada CD em toneladas
-    ofertas_A = [50, 75, 85]
+    ofertas_B = np.array([30, 60, 50], dtype=np.int32)
 
     # Demandas de cada CC em toneladas
-    demandas_A = [16, 20, 12, 18, 14]  # Total = 80 toneladas
+    demandas_B = np.array([10, 14, 12, 16, 8], dtype=np.int32)  # Total = 60 toneladas
+
+    # A geração dos arquivos LINDO é só trabalho de string: disparada
+    # em threads para rodar em paralelo com o subprocesso do CBC
+    executor = ThreadPoolExecutor(max_workers=2)
+    futuro_lindo_A = executor.submit(
+        gerar_formato_lindo,
+        custos_instalacao, custos_transporte_A, ofertas_A, demandas_A,
+        cds_instalados, "Combustivel_A"
+    )
+    futuro_lindo_B = executor.submit(
+        gerar_formato_lindo,
+        custos_instalacao, custos_transporte_B, ofertas_B, demandas_B,
+        cds_instalados, "Combustivel_B"
+    )
 
-    prob_A, y_A, x_A = resolver_plc(
-        "Combustivel_A",
+    # Os dois combustíveis são resolvidos numa única chamada ao CBC
+    # (MIP bloco-diagonal), amortizando o custo do subprocesso
+    prob, resultados = resolver_plc_lote(
+        "Texas_Petro",
         custos_instalacao,
-        custos_transporte_A,
-        ofertas_A,
-        demandas_A,
+        [
+            ("A", custos_transporte_A, ofertas_A, demandas_A),
+            ("B", custos_transporte_B, ofertas_B, demandas_B),
+        ],
         cds_instalados
     )
+    (objetivo_A, y_A, x_A), (objetivo_B, y_B, x_B) = resultados
+
+    # -------------------------------------------------------------------------
+    # COMBUSTÍVEL A
+    # -------------------------------------------------------------------------
+    print("\n" + "▓" * 70)
+    print("  COMBUSTÍVEL A")
+    print("▓" * 70)
 
     resultado_A = exibir_resultados(
-        prob_A, y_A, x_A, "COMBUSTÍVEL A",
-        custos_instalacao, custos_transporte_A, ofertas_A, demandas_A
+        prob, y_A, x_A, "COMBUSTÍVEL A",
+        custos_instalacao, custos_transporte_A, ofertas_A, demandas_A,
+        objetivo=value(objetivo_A)
     )
 
     # -------------------------------------------------------------------------
@@ -282,49 +656,22 @@ def main():
     print("  COMBUSTÍVEL B")
     print("▓" * 70)
 
-    # Custos de transporte [CD][CC] - Combustível B
-    custos_transporte_B = [
-        [37, 39, 54, 45, 25],  # CD1 -> CC1, CC2, CC3, CC4, CC5
-        [23, 34, 21, 34, 70],  # CD2 -> CC1, CC2, CC3, CC4, CC5
-        [21, 38, 45, 38, 68],  # CD3 -> CC1, CC2, CC3, CC4, CC5
-    ]
-
-    # Ofertas (capacidade) de cada CD em toneladas
-    ofertas_B = [30, 60, 50]
-
-    # Demandas de cada CC em toneladas
-    demandas_B = [10, 14, 12, 16, 8]  # Total = 60 toneladas
-
-    prob_B, y_B, x_B = resolver_plc(
-        "Combustivel_B",
-        custos_instalacao,
-        custos_transporte_B,
-        ofertas_B,
-        demandas_B,
-        cds_instalados
-    )
-
     resultado_B = exibir_resultados(
-        prob_B, y_B, x_B, "COMBUSTÍVEL B",
-        custos_instalacao, custos_transporte_B, ofertas_B, demandas_B
+        prob, y_B, x_B, "COMBUSTÍVEL B",
+        custos_instalacao, custos_transporte_B, ofertas_B, demandas_B,
+        objetivo=value(objetivo_B)
     )
 
     # -------------------------------------------------------------------------
     # GERAR ARQUIVOS LINDO
     # -------------------------------------------------------------------------
-    lindo_A = gerar_formato_lindo(
-        custos_instalacao, custos_transporte_A, ofertas_A, demandas_A,
-        cds_instalados, "Combustivel_A"
-    )
     with open("lindo_combustivel_A.txt", "w") as f:
-        f.write(lindo_A)
+        f.write(futuro_lindo_A.result())
 
-    lindo_B = gerar_formato_lindo(
-        custos_instalacao, custos_transporte_B, ofertas_B, demandas_B,
-        cds_instalados, "Combustivel_B"
-    )
     with open("lindo_combustivel_B.txt", "w") as f:
-        f.write(lindo_B)
+        f.write(futuro_lindo_B.result())
+
+    executor.shutdown()
 
     print("\n  Arquivos LINDO gerados: lindo_combustivel_A.txt, lindo_combustivel_B.txt")
 
@@ -0,0 +1,283 @@
+"""
+Kernel Numba para o Problema de Localização de Capacidades (PLC)
+
+Versão compilada do solver enumerativo de plc_solver.py, pensada para
+varreduras de cenários (muitos combustíveis / matrizes de custo): o
+subproblema de transporte de cada combinação de instalação é resolvido
+pelo método do canto noroeste seguido do método MODI (potenciais u-v),
+tudo dentro de funções @njit — sem o overhead por chamada do scipy nem o
+subprocesso do CBC. A compilação acontece uma única vez no import
+(assinaturas explícitas) e fica em cache entre execuções.
+"""
+
+import numpy as np
+from numba import njit, boolean, float64, int64
+from numba.types import Tuple
+
+_EPS = 1e-9
+
+_SIG_TRANSPORTE = Tuple((float64, float64[:, :]))(
+    float64[:, :], float64[:], float64[:]
+)
+
+
+@njit(_SIG_TRANSPORTE, cache=True, fastmath=True)
+def resolver_transporte(custos, ofertas, demandas):
+    """
+    Resolve um problema de transporte (ofertas ≥ demandas)
+
+    Constrói uma solução básica pelo canto noroeste e a leva ao ótimo
+    com o método MODI. Se a oferta exceder a demanda, um CC fictício de
+    custo zero absorve a folga. Retorna (custo, x) com x no formato
+    original [CD][CC]; custo = inf se o problema for inviável.
+    """
+
+    num_cds = ofertas.shape[0]
+    num_ccs = demandas.shape[0]
+
+    folga = np.sum(ofertas) - np.sum(demandas)
+    if folga < -_EPS:
+        return np.inf, np.zeros((num_cds, num_ccs))
+
+    # Balancear com um CC fictício que absorve a oferta excedente
+    n = num_ccs + 1 if folga > _EPS else num_ccs
+    c = np.zeros((num_cds, n))
+    c[:, :num_ccs] = custos
+    b = np.zeros(n)
+    b[:num_ccs] = demandas
+    if n > num_ccs:
+        b[num_ccs] = folga
+
+    x = np.zeros((num_cds, n))
+    base = np.zeros((num_cds, n), dtype=boolean)
+
+    # Canto noroeste: gera exatamente num_cds + n - 1 células básicas
+    resto_a = ofertas.copy()
+    resto_b = b.copy()
+    i = 0
+    j = 0
+    while True:
+        q = min(resto_a[i], resto_b[j])
+        x[i, j] = q
+        base[i, j] = True
+        resto_a[i] -= q
+        resto_b[j] -= q
+        if i == num_cds - 1 and j == n - 1:
+            break
+        if i == num_cds - 1:
+            j += 1
+        elif j == n - 1:
+            i += 1
+        elif resto_a[i] <= resto_b[j]:
+            i += 1
+        else:
+            j += 1
+
+    u = np.zeros(num_cds)
+    v = np.zeros(n)
+    ciclo = np.zeros((num_cds, n), dtype=boolean)
+
+    for _ in range(200):
+        # Potenciais u e v a partir das células básicas (u1 = 0)
+        u_ok = np.zeros(num_cds, dtype=boolean)
+        v_ok = np.zeros(n, dtype=boolean)
+        u[0] = 0.0
+        u_ok[0] = True
+        for _ in range(num_cds + n):
+            for i in range(num_cds):
+                for j in range(n):
+                    if not base[i, j]:
+                        continue
+                    if u_ok[i] and not v_ok[j]:
+                        v[j] = c[i, j] - u[i]
+                        v_ok[j] = True
+                    elif v_ok[j] and not u_ok[i]:
+                        u[i] = c[i, j] - v[j]
+                        u_ok[i] = True
+
+        # Célula que entra na base: custo reduzido mais negativo
+        melhor = -_EPS
+        ei = -1
+        ej = -1
+        for i in range(num_cds):
+            for j in range(n):
+                if base[i, j]:
+                    continue
+                reduzido = c[i, j] - u[i] - v[j]
+                if reduzido < melhor:
+                    melhor = reduzido
+                    ei = i
+                    ej = j
+        if ei < 0:
+            break  # ótimo
+
+        # Isolar o ciclo: remover células que são as únicas da sua
+        # linha ou coluna até sobrar apenas o circuito fechado
+        for i in range(num_cds):
+            for j in range(n):
+                ciclo[i, j] = base[i, j]
+        ciclo[ei, ej] = True
+        mudou = True
+        while mudou:
+            mudou = False
+            for i in range(num_cds):
+                cont = 0
+                for j in range(n):
+                    if ciclo[i, j]:
+                        cont += 1
+                        jj = j
+                if cont == 1:
+                    ciclo[i, jj] = False
+                    mudou = True
+            for j in range(n):
+                cont = 0
+                for i in range(num_cds):
+                    if ciclo[i, j]:
+                        cont += 1
+                        ii = i
+                if cont == 1:
+                    ciclo[ii, j] = False
+                    mudou = True
+
+        # Percorrer o ciclo alternando linha/coluna a partir da célula
+        # que entra; posições ímpares do percurso perdem fluxo
+        theta = np.inf
+        si = -1
+        sj = -1
+        pi = ei
+        pj = ej
+        por_linha = True
+        passo = 0
+        while True:
+            if por_linha:
+                for j in range(n):
+                    if j != pj and ciclo[pi, j]:
+                        pj = j
+                        break
+            else:
+                for i in range(num_cds):
+                    if i != pi and ciclo[i, pj]:
+                        pi = i
+                        break
+            por_linha = not por_linha
+            passo += 1
+            if pi == ei and pj == ej:
+                break
+            if passo % 2 == 1 and x[pi, pj] < theta:
+                theta = x[pi, pj]
+                si = pi
+                sj = pj
+
+        # Pivotear: theta circula pelo ciclo; a célula que zerou sai
+        pi = ei
+        pj = ej
+        por_linha = True
+        passo = 0
+        x[ei, ej] += theta
+        while True:
+            if por_linha:
+                for j in range(n):
+                    if j != pj and ciclo[pi, j]:
+                        pj = j
+                        break
+            else:
+                for i in range(num_cds):
+                    if i != pi and ciclo[i, pj]:
+                        pi = i
+                        break
+            por_linha = not por_linha
+            passo += 1
+            if pi == ei and pj == ej:
+                break
+            if passo % 2 == 1:
+                x[pi, pj] -= theta
+            else:
+                x[pi, pj] += theta
+        base[ei, ej] = True
+        base[si, sj] = False
+
+    custo = 0.0
+    for i in range(num_cds):
+        for j in range(num_ccs):
+            custo += c[i, j] * x[i, j]
+
+    return custo, x[:, :num_ccs]
+
+
+_SIG_PLC = Tuple((float64, int64[:], float64[:, :]))(
+    float64[:], float64[:, :], float64[:], float64[:], int64
+)
+
+
+@njit(_SIG_PLC, cache=True, fastmath=True)
+def resolver_plc_kernel(custos_instalacao, custos_transporte, ofertas,
+                        demandas, obrigatorios):
+    """
+    Enumera as combinações de instalação e resolve cada transporte
+
+    obrigatorios é a máscara de bits dos CDs que precisam estar
+    instalados. Retorna (custo, y, x); custo = inf se inviável.
+    """
+
+    num_cds = ofertas.shape[0]
+    num_ccs = demandas.shape[0]
+    demanda_total = np.sum(demandas)
+
+    melhor_custo = np.inf
+    melhor_y = np.zeros(num_cds, dtype=int64)
+    melhor_x = np.zeros((num_cds, num_ccs))
+
+    for mask in range(1 << num_cds):
+        if (mask & obrigatorios) != obrigatorios:
+            continue
+        capacidade = 0.0
+        for i in range(num_cds):
+            if (mask >> i) & 1:
+                capacidade += ofertas[i]
+        if capacidade < demanda_total - _EPS:
+            continue
+
+        ofertas_y = np.zeros(num_cds)
+        fixo = 0.0
+        for i in range(num_cds):
+            if (mask >> i) & 1:
+                ofertas_y[i] = ofertas[i]
+                fixo += custos_instalacao[i]
+
+        custo, x = resolver_transporte(custos_transporte, ofertas_y, demandas)
+        custo += fixo
+        if custo < melhor_custo:
+            melhor_custo = custo
+            for i in range(num_cds):
+                melhor_y[i] = (mask >> i) & 1
+            melhor_x = x
+
+    return melhor_custo, melhor_y, melhor_x
+
+
+def resolver_plc_rapido(custos_instalacao, custos_transporte, ofertas,
+                        demandas, cds_instalados):
+    """
+    Interface em Python puro para o kernel compilado
+
+    Aceita os mesmos argumentos (listas ou arrays) de resolver_plc e
+    devolve (status, objetivo, y, x) no formato de
+    resolver_plc_enumerativo.
+    """
+
+    obrigatorios = 0
+    for i in cds_instalados:
+        obrigatorios |= 1 << i
+
+    custo, y, x = resolver_plc_kernel(
+        np.asarray(custos_instalacao, dtype=np.float64),
+        np.asarray(custos_transporte, dtype=np.float64),
+        np.asarray(ofertas, dtype=np.float64),
+        np.asarray(demandas, dtype=np.float64),
+        obrigatorios,
+    )
+
+    if not np.isfinite(custo):
+        return "Infeasible", None, None, None
+
+    return "Optimal", custo, [int(v) for v in y], x